@@ -25,17 +25,13 @@ class NEODatabase:
     def __init__(self, neos, approaches):
         """Create a new `NEODatabase`.
 
-        As a precondition, this constructor assumes that the collections of NEOs
-        and close approaches haven't yet been linked - that is, the
-        `.approaches` attribute of each `NearEarthObject` resolves to an empty
-        collection, and the `.neo` attribute of each `CloseApproach` is None.
-
-        However, each `CloseApproach` has an attribute (`._designation`) that
+        Each `CloseApproach` has an attribute (`._designation`) that
         matches the `.designation` attribute of the corresponding NEO. This
         constructor modifies the supplied NEOs and close approaches to link them
         together - after it's done, the `.approaches` attribute of each NEO has
-        a collection of that NEO's close approaches, and the `.neo` attribute of
-        each close approach references the appropriate NEO.
+        a tuple of that NEO's close approaches, and the `.neo` attribute of
+        each close approach references the appropriate NEO. Any existing links
+        are replaced, so linking the same objects again is safe.
 
         :param neos: A collection of `NearEarthObject`s.
         :param approaches: A collection of `CloseApproach`es.
@@ -47,12 +43,23 @@ class NEODatabase:
         self.neos_by_designation = {neo.designation: neo for neo in neos}
         self.neos_by_name = {neo.name: neo for neo in neos}
 
-        # Link together the NEOs and their close approaches.
+        # Link together the NEOs and their close approaches, grouping each NEO's
+        # approaches locally rather than mutating `.approaches` mid-link.
+        approaches_by_neo = {}
         for close_approach in self._approaches:
             neo = self.neos_by_designation[close_approach._designation]
-            neo.approaches.append(close_approach)
+            linked_approaches = approaches_by_neo.get(neo)
+            if linked_approaches is None:
+                approaches_by_neo[neo] = [close_approach]
+            else:
+                linked_approaches.append(close_approach)
             close_approach.neo = neo
 
+        # Store each NEO's approaches as an exactly-sized tuple rather than an
+        # over-allocated, growable list. NEOs without approaches get `()`.
+        for neo in self._neos:
+            neo.approaches = tuple(approaches_by_neo.get(neo, ()))
+
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
 
@@ -103,11 +110,9 @@ class NEODatabase:
         :return: A stream of matching `CloseApproach` objects.
         """
         # Generate `CloseApproach` objects that match all of the filters.
-        for approach in self._approaches:
-            flag = True
-            for f in filters:
-                if not f(approach):
-                    flag = False
-                    break
-            if flag:
-                yield approach
+        # Chaining the builtin `filter` keeps the per-approach loop in C and
+        # still short-circuits at the first filter an approach fails.
+        results = iter(self._approaches)
+        for f in filters:
+            results = filter(f, results)
+        yield from results
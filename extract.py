@@ -17,6 +17,26 @@ import json
 
 from models import NearEarthObject, CloseApproach
 
+# The columns of the NEO CSV file and the fields of the close approach JSON file
+# used by the models, in the order their constructors take them.
+_NEO_COLUMNS = ('pdes', 'name', 'diameter', 'pha')
+_APPROACH_FIELDS = ('des', 'cd', 'dist', 'v_rel')
+
+
+def _column_indices(header, columns, path):
+    """Find the position of each of the given columns in a data file's header.
+
+    :param header: The column names of the data file, in order.
+    :param columns: The names of the columns to locate.
+    :param path: The path of the data file, used in error messages.
+    :return: A tuple of the positions of `columns` within `header`.
+    :raises ValueError: If any of the columns is missing from the header.
+    """
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"{path} is missing required column(s): {', '.join(missing)}")
+    return tuple(header.index(column) for column in columns)
+
 
 def load_neos(neo_csv_path):
     """Read near-Earth object information from a CSV file.
@@ -25,12 +45,18 @@ def load_neos(neo_csv_path):
     :return: A collection of `NearEarthObject`s.
     """
     # Load NEO data from the given CSV file.
-    output = []
-    with open(neo_csv_path, 'r') as file_in:
-        reader = csv.DictReader(file_in)
-        for row in reader:
-            output.append(NearEarthObject(**row))
-    return output
+    # Locate the few columns of interest once from the header, rather than
+    # building a dictionary of every column for each row.
+    with open(neo_csv_path, 'r', newline='') as file_in:
+        reader = csv.reader(file_in)
+        header = next(reader, None)
+        if header is None:
+            # An empty file holds no NEOs.
+            return []
+        i_pdes, i_name, i_diameter, i_pha = _column_indices(header, _NEO_COLUMNS, neo_csv_path)
+        # Like `csv.DictReader`, skip blank lines, which `csv.reader` yields as empty rows.
+        return [NearEarthObject(row[i_pdes], row[i_name], row[i_diameter], row[i_pha])
+                for row in reader if row]
 
 
 def load_approaches(cad_json_path):
@@ -40,10 +66,9 @@ def load_approaches(cad_json_path):
     :return: A collection of `CloseApproach`es.
     """
     # Load close approach data from the given JSON file.
-    output = []
+    # Locate the few fields of interest once, rather than zipping every field
+    # of each row into a dictionary.
     with open(cad_json_path, 'r') as file_in:
         data = json.load(file_in)
-        for ca in data['data']:
-            close_approach_dict = dict(zip(data['fields'], ca))
-            output.append(CloseApproach(**close_approach_dict))
-    return output
+    i_des, i_cd, i_dist, i_v_rel = _column_indices(data['fields'], _APPROACH_FIELDS, cad_json_path)
+    return [CloseApproach(ca[i_des], ca[i_cd], ca[i_dist], ca[i_v_rel]) for ca in data['data']]
@@ -12,6 +12,10 @@ provide that level of resolution, so the output format also will not.
 """
 import datetime
 
+# English-locale abbreviated month names, as used in the `cd` field, mapped to month numbers.
+_MONTHS = {name: number for number, name in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)}
+
 
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
@@ -26,6 +30,19 @@ def cd_to_datetime(calendar_date):
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
+    # The format is fixed-width, so slice out each field rather than paying for
+    # `strptime`'s format parsing. Only a string with exactly that layout takes
+    # this path; anything else goes to `strptime`, which accepts or rejects it.
+    if (len(calendar_date) == 17 and calendar_date[4] == '-' and calendar_date[8] == '-'
+            and calendar_date[11] == ' ' and calendar_date[14] == ':'):
+        year, day = calendar_date[0:4], calendar_date[9:11]
+        hour, minute = calendar_date[12:14], calendar_date[15:17]
+        month = _MONTHS.get(calendar_date[5:8])
+        if month is not None and (year + day + hour + minute).isdigit():
+            try:
+                return datetime.datetime(int(year), month, int(day), int(hour), int(minute))
+            except ValueError:
+                pass
     return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
 
 
@@ -41,4 +58,6 @@ def datetime_to_str(dt):
     :param dt: A naive Python datetime.
     :return: That datetime, as a human-readable string without seconds.
     """
-    return datetime.datetime.strftime(dt, "%Y-%m-%d %H:%M")
+    # `isoformat` produces the same "%Y-%m-%d %H:%M" text without `strftime`'s
+    # format-string processing. A naive datetime has no UTC offset suffix.
+    return dt.isoformat(sep=' ', timespec='minutes')
@@ -18,7 +18,10 @@ quirks of the data set, such as missing names and unknown diameters.
 You'll edit this file in Task 1.
 """
 from helpers import cd_to_datetime, datetime_to_str
-import math
+import sys
+
+# Shared "unknown" value for missing diameters, distances and velocities.
+_NAN = float('nan')
 
 
 class NearEarthObject:
@@ -34,11 +37,22 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    # The data set holds tens of thousands of NEOs, so avoid a per-instance `__dict__`.
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches', '_fullname')
+
     # How can you, and should you, change the arguments to this constructor?
     # If you make changes, be sure to update the comments in this file.
-    def __init__(self, **info):
+    def __init__(self, pdes=None, name=None, diameter=_NAN, pha=None, **info):
         """Create a new `NearEarthObject`.
 
+        The parameters are named after the columns of NASA's NEO data, so a row
+        can be supplied positionally, which skips building and unpacking a
+        keyword dictionary, or as keyword arguments.
+
+        :param pdes: The primary designation of the NEO.
+        :param name: The IAU name of the NEO, or an empty string.
+        :param diameter: The diameter of the NEO in kilometers, or an empty string.
+        :param pha: 'Y' if the NEO is potentially hazardous, 'N' if not, or an empty string.
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
         # Assign information from the arguments passed to the constructor
@@ -46,37 +60,40 @@ class NearEarthObject:
         # You should coerce these values to their appropriate data type and
         # handle any edge cases, such as a empty name being represented by `None`
         # and a missing diameter being represented by `float('nan')`.
-        # Initialize string variable for hazardous message referenced in __str__ method.
-
-        # Coerce designation to str type
-        self.designation = str(info.get('pdes', None))
-        if self.designation == '':
-            self.designation = None
-
-        # Coerce name to str type
-        self.name = str(info.get('name', None))
-        if self.name == '':
-            self.name = None
-
-        # Coerce diameter to float type
-        diam = info.get('diameter', float('nan'))
-        if diam == '':
-            self.diameter = float('nan')
-        else:
-            self.diameter = float(diam)
 
-        # Coerce hazardous attribute to boolean type
-        self.hazardous = info.get('pha', 'None') == 'Y'
+        # Coerce designation to an interned str, shared with each `CloseApproach` of this NEO
+        self.designation = sys.intern(pdes) if pdes else None
 
-        # Define hazardous message part
-        self.hazardous_str = info.get('pha', 'None')
+        # Coerce name to an interned str type
+        self.name = sys.intern(name) if name else None
 
-        # Create an empty initial collection of linked approaches.
-        self.approaches = []
+        # Coerce diameter to float type; a missing diameter is rare, so let float() reject it
+        try:
+            self.diameter = float(diameter)
+        except (TypeError, ValueError):
+            self.diameter = _NAN
+
+        # Coerce hazardous attribute to boolean type; an unknown flag is not hazardous
+        self.hazardous = pha == 'Y'
+
+        # Create an empty initial collection of linked approaches. The empty tuple is
+        # a shared singleton, so no per-NEO object is allocated here; `NEODatabase`
+        # replaces it with a tuple of this NEO's approaches, if it has any.
+        self.approaches = ()
+
+        # The full name is built on first use of `fullname`.
+        self._fullname = None
 
     @property
     def fullname(self):
-        """Return a representation of the full name of this NEO."""
+        """Return a representation of the full name of this NEO.
+
+        The result is cached, since it is used by every string representation
+        and serialization of this NEO and its close approaches.
+        """
+        if self._fullname is not None:
+            return self._fullname
+
         # Use self.designation and self.name to build a fullname for this object.
         fullname_str = self.designation
 
@@ -85,6 +102,7 @@ class NearEarthObject:
         elif fullname_str is None:
             fullname_str = 'None'
 
+        self._fullname = fullname_str
         return fullname_str
 
     def __str__(self):
@@ -94,15 +112,13 @@ class NearEarthObject:
         # method for examples of advanced string formatting.
 
         # Define hazardous message part
-        if self.hazardous_str == 'None':
-            hazard_str = "[is/is not]"
-        elif self.hazardous:
+        if self.hazardous:
             hazard_str = "is"
         else:
             hazard_str = "is not"
 
-        # Define diameter message part
-        if math.isnan(self.diameter):
+        # Define diameter message part (NaN is the only value not equal to itself)
+        if self.diameter != self.diameter:
             diameter_str = "undefined"
         else:
             diameter_str = f"{self.diameter:.3f}"
@@ -137,11 +153,22 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    # The data set holds hundreds of thousands of approaches, so avoid a per-instance `__dict__`.
+    __slots__ = ('_designation', 'time', 'distance', 'velocity', 'neo', '_time_str')
+
     # How can you, and should you, change the arguments to this constructor?
     # If you make changes, be sure to update the comments in this file.
-    def __init__(self, **info):
+    def __init__(self, des=None, cd=None, dist=_NAN, v_rel=_NAN, **info):
         """Create a new `CloseApproach`.
 
+        The parameters are named after the fields of NASA's close approach data,
+        so a row can be supplied positionally, which skips building and unpacking
+        a keyword dictionary, or as keyword arguments.
+
+        :param des: The primary designation of the approaching NEO.
+        :param cd: The calendar date of the approach in YYYY-bb-DD hh:mm format.
+        :param dist: The nominal approach distance in astronomical units.
+        :param v_rel: The relative approach velocity in kilometers per second.
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
         # Assign information from the arguments passed to the constructor
@@ -149,13 +176,11 @@ class CloseApproach:
         # You should coerce these values to their appropriate data type and handle any edge cases.
         # The `cd_to_datetime` function will be useful.
 
-        # Coerce self._designation to str type
-        self._designation = str(info.get('des', None))
-        if self._designation == '':
-            self._designation = None
+        # Coerce self._designation to an interned str type; the many approaches of
+        # one NEO then share a single string object, which also matches the NEO's own.
+        self._designation = sys.intern(des) if des else None
 
         # Check for null or blank cd (calendar date)
-        cd = str(info.get('cd', None))
         if cd == '':
             cd = None
 
@@ -166,22 +191,23 @@ class CloseApproach:
             self.time = None
 
         # Nominal approach distance in astronomical units (au) to Earth at closest point
-        self.distance = info.get('dist', float('nan'))
-        if self.distance == '':
-            self.distance = float('nan')
-        else:
-            self.distance = float(self.distance)
+        try:
+            self.distance = float(dist)
+        except (TypeError, ValueError):
+            self.distance = _NAN
 
         # Velocity in kilometers (km) per second relative Earth at closest point
-        self.velocity = info.get('v_rel', float('nan'))
-        if self.velocity == '':
-            self.velocity = float('nan')
-        else:
-            self.velocity = float(self.velocity)
+        try:
+            self.velocity = float(v_rel)
+        except (TypeError, ValueError):
+            self.velocity = _NAN
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = None
 
+        # The formatted time is built on first use of `time_str`.
+        self._time_str = None
+
     @property
     def time_str(self):
         """Return a formatted representation of this `CloseApproach`'s approach time.
@@ -196,12 +222,16 @@ class CloseApproach:
         in serialization to CSV and JSON files.
         """
         # Use this object's `.time` attribute and the `datetime_to_str` function to
-        # build a formatted representation of the approach time.
+        # build a formatted representation of the approach time, once.
+        if self._time_str is not None:
+            return self._time_str
+
         if self.time is not None:
             formatted_datetime_str = datetime_to_str(self.time)
         else:
             formatted_datetime_str = 'Undefined'
 
+        self._time_str = formatted_datetime_str
         return formatted_datetime_str
 
     @property
@@ -54,6 +54,12 @@ class TestDatabase(unittest.TestCase):
                     self.fail(f"{approach} appears in the approaches of multiple NEOs.")
                 seen.add(approach)
 
+    def test_database_construction_can_relink_the_same_objects(self):
+        linked = {neo: neo.approaches for neo in self.neos}
+        NEODatabase(self.neos, self.approaches)
+        for neo in self.neos:
+            self.assertEqual(neo.approaches, linked[neo])
+
     def test_get_neo_by_designation(self):
         cerberus = self.db.get_neo_by_designation('1865')
         self.assertIsNotNone(cerberus)
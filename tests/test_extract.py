@@ -14,6 +14,7 @@ import collections.abc
 import datetime
 import pathlib
 import math
+import tempfile
 import unittest
 
 from extract import load_neos, load_approaches
@@ -118,5 +119,36 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TestLoadIrregularFiles(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def test_load_neos_names_file_and_missing_column(self):
+        path = pathlib.Path(self.tempdir.name) / 'neos.csv'
+        path.write_text('pdes,name,pha\n433,Eros,N\n')
+        with self.assertRaisesRegex(ValueError, r'neos\.csv.*diameter'):
+            load_neos(path)
+
+    def test_load_neos_skips_blank_lines(self):
+        path = pathlib.Path(self.tempdir.name) / 'neos.csv'
+        path.write_text('pdes,name,diameter,pha\n\n433,Eros,16.84,N\n\n')
+        neos = load_neos(path)
+        self.assertEqual(len(neos), 1)
+        self.assertEqual(neos[0].designation, '433')
+        self.assertEqual(neos[0].name, 'Eros')
+
+    def test_load_neos_from_empty_file_is_empty(self):
+        path = pathlib.Path(self.tempdir.name) / 'neos.csv'
+        path.write_text('')
+        self.assertEqual(load_neos(path), [])
+
+    def test_load_approaches_names_file_and_missing_field(self):
+        path = pathlib.Path(self.tempdir.name) / 'cad.json'
+        path.write_text('{"fields": ["des", "cd", "dist"], "data": [["433", "1900-Dec-27 01:30", "0.3"]]}')
+        with self.assertRaisesRegex(ValueError, r'cad\.json.*v_rel'):
+            load_approaches(path)
+
+
 if __name__ == '__main__':
     unittest.main()
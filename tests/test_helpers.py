@@ -0,0 +1,92 @@
+"""Check that calendar dates are converted to and from datetimes correctly.
+
+The `cd_to_datetime` function should agree with `datetime.strptime` on NASA's
+`YYYY-bb-DD hh:mm` format, and reject anything `strptime` would reject. The
+`datetime_to_str` function should agree with `strftime('%Y-%m-%d %H:%M')`.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+
+These tests should pass when Task 1 is complete.
+"""
+import datetime
+import json
+import pathlib
+import unittest
+
+from helpers import cd_to_datetime, datetime_to_str
+
+
+TESTS_ROOT = (pathlib.Path(__file__).parent).resolve()
+TEST_CAD_FILE = TESTS_ROOT / 'test-cad-2020.json'
+
+CD_FORMAT = "%Y-%b-%d %H:%M"
+
+
+class TestCdToDatetime(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(TEST_CAD_FILE, 'r') as file_in:
+            data = json.load(file_in)
+        i_cd = data['fields'].index('cd')
+        cls.calendar_dates = [row[i_cd] for row in data['data']]
+
+    def test_cd_to_datetime_matches_strptime_on_test_data(self):
+        for calendar_date in self.calendar_dates:
+            with self.subTest(calendar_date=calendar_date):
+                self.assertEqual(cd_to_datetime(calendar_date),
+                                 datetime.datetime.strptime(calendar_date, CD_FORMAT))
+
+    def test_cd_to_datetime_matches_strptime_on_each_month(self):
+        for month in range(1, 13):
+            expected = datetime.datetime(2020, month, 28, 23, 59)
+            calendar_date = expected.strftime(CD_FORMAT)
+            with self.subTest(calendar_date=calendar_date):
+                self.assertEqual(cd_to_datetime(calendar_date), expected)
+
+    def test_cd_to_datetime_matches_strptime_on_boundaries(self):
+        for calendar_date in ('1900-Jan-01 00:00', '2099-Dec-31 23:59', '2020-Feb-29 12:30'):
+            with self.subTest(calendar_date=calendar_date):
+                self.assertEqual(cd_to_datetime(calendar_date),
+                                 datetime.datetime.strptime(calendar_date, CD_FORMAT))
+
+    def test_cd_to_datetime_matches_strptime_on_unpadded_dates(self):
+        # These aren't in the fixed-width layout, but `strptime` accepts them.
+        for calendar_date in ('2020-Jan-1 00:00', '2020-Jan-01 1:05', '2020-jan-01 00:00'):
+            with self.subTest(calendar_date=calendar_date):
+                self.assertEqual(cd_to_datetime(calendar_date),
+                                 datetime.datetime.strptime(calendar_date, CD_FORMAT))
+
+    def test_cd_to_datetime_rejects_malformed_dates(self):
+        malformed = (
+            '2020-Jan-01 00:00 garbage',
+            '2020-Jan-01T00:00',
+            '2020xJanx01x00x00',
+            '2020-Jan-+1 00:00',
+            '2020-Jan-01 0:000',
+            '2020-jan-01 00:00x',
+            '2020-Foo-01 00:00',
+            '2021-Feb-29 00:00',
+            '2020-Jan-01 24:00',
+            '2020-Jan-32 00:00',
+            '',
+        )
+        for calendar_date in malformed:
+            with self.subTest(calendar_date=calendar_date):
+                with self.assertRaises(ValueError):
+                    datetime.datetime.strptime(calendar_date, CD_FORMAT)
+                with self.assertRaises(ValueError):
+                    cd_to_datetime(calendar_date)
+
+
+class TestDatetimeToStr(unittest.TestCase):
+    def test_datetime_to_str_matches_strftime(self):
+        for dt in (datetime.datetime(1900, 1, 1, 0, 0), datetime.datetime(2020, 12, 31, 12, 5),
+                   datetime.datetime(2099, 6, 15, 23, 59, 59)):
+            with self.subTest(dt=dt):
+                self.assertEqual(datetime_to_str(dt), dt.strftime("%Y-%m-%d %H:%M"))
+
+
+if __name__ == '__main__':
+    unittest.main()
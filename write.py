@@ -29,19 +29,16 @@ def write_to_csv(results, filename):
         'designation', 'name', 'diameter_km', 'potentially_hazardous'
     )
     # Write the results to a CSV file, following the specification in the instructions.
+    # Rows are written as tuples in `fieldnames` order, which spares `DictWriter`'s
+    # per-row dictionary and key-to-column mapping.
     with open(filename, 'w') as file_out:
-        writer = csv.DictWriter(file_out, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in results:
-            writer.writerow({
-                'datetime_utc': row.time_str,
-                'distance_au': row.distance,
-                'velocity_km_s': row.velocity,
-                'designation': row._designation,
-                'name': row.full_name,
-                'diameter_km': row.neo.diameter,
-                'potentially_hazardous': row.neo.hazardous
-            })
+        writer = csv.writer(file_out)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (row.time_str, row.distance, row.velocity, row._designation,
+             row.full_name, row.neo.diameter, row.neo.hazardous)
+            for row in results
+        )
 
 
 def write_to_json(results, filename):
@@ -59,9 +56,11 @@ def write_to_json(results, filename):
     json_output = []
 
     for close_approach in results:
-        neo_dict = close_approach.neo.serialize()
-        result_dict = {**close_approach.serialize(), 'neo': {**neo_dict}}
+        result_dict = close_approach.serialize()
+        result_dict['neo'] = close_approach.neo.serialize()
         json_output.append(result_dict)
 
+    # `json.dumps` without `indent` uses the C encoder; `json.dump` and any
+    # indented output fall back to the pure-Python encoder.
     with open(filename, 'w') as file_out:
-        json.dump(json_output, file_out, indent=2)
+        file_out.write(json.dumps(json_output))